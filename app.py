@@ -4,20 +4,44 @@ GUI Frontend for Real-Time Audio Effect Chain Application.
 Imports logic from audio_engine.py.
 """
 
+import contextlib
+import functools
+import queue
+import threading
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
+from collections import ChainMap
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
-import numpy as np
+from typing import List, Mapping, MutableMapping, Optional
 
 # Import backend logic
 from audio_engine import (
+    DEFAULT_PARAMETERS,
     EFFECTS,
+    EFFECTS_SOA,
     RealTimeAudioProcessor,
     LiveRecordingSession,
     FilePlaybackSession
 )
 
+
+@functools.lru_cache(maxsize=32)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Shared CTkFont per (size, weight) - widgets never need their own copy"""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+@contextlib.contextmanager
+def _held_layout(container, **pack_kwargs):
+    """Unmap a packed container while several children are packed/forgotten,
+    so Tk lays the batch out once when the container is packed back"""
+    container.pack_forget()
+    try:
+        yield
+    finally:
+        container.pack(**pack_kwargs)
+
+
 class DownloadDialog(ctk.CTkToplevel):
     """Dialog to download processed audio"""
 
@@ -27,7 +51,9 @@ class DownloadDialog(ctk.CTkToplevel):
         self.processor = processor
 
         self.title("Download Processed Audio")
-        self.geometry("400x200")
+        # Extra room for the dropped-blocks warning
+        height = 230 if processor.recording_overruns else 200
+        self.geometry(f"400x{height}")
         self.resizable(False, False)
 
         self.transient(parent)
@@ -36,52 +62,67 @@ class DownloadDialog(ctk.CTkToplevel):
         # Center on parent
         self.update_idletasks()
         x = parent.winfo_x() + (parent.winfo_width() - 400) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 200) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - height) // 2
         self.geometry(f"+{x}+{y}")
 
         # Message
         ctk.CTkLabel(
             self,
             text="💾 Save Processed Audio",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color="#2ecc71"
         ).pack(pady=(20, 10))
 
-        if processor.recorded_chunks:
-            duration = len(np.concatenate(processor.recorded_chunks)) / processor.samplerate
-        else:
-            duration = 0.0
+        duration = processor.recorded_frames / processor.samplerate
 
-        ctk.CTkLabel(
+        self.info_label = ctk.CTkLabel(
             self,
             text=f"Duration: {duration:.1f} seconds",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="gray"
-        ).pack(pady=5)
+        )
+        self.info_label.pack(pady=5)
+
+        overruns = processor.recording_overruns
+        if overruns:
+            # The writer fell behind and these blocks never reached the take
+            ctk.CTkLabel(
+                self,
+                text=f"⚠ {overruns} blocks were dropped from this recording",
+                font=_font(12),
+                text_color="#e67e22"
+            ).pack()
 
         # Buttons
         button_frame = ctk.CTkFrame(self, fg_color="transparent")
         button_frame.pack(pady=20, fill="x", padx=20)
 
-        ctk.CTkButton(
+        self.save_btn = ctk.CTkButton(
             button_frame,
             text="💾 Save As...",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             height=40,
             command=self.save_file,
             fg_color=("#2ecc71", "#27ae60")
-        ).pack(side="left", expand=True, fill="x", padx=(0, 5))
+        )
+        self.save_btn.pack(side="left", expand=True, fill="x", padx=(0, 5))
 
-        ctk.CTkButton(
+        self.cancel_btn = ctk.CTkButton(
             button_frame,
             text="Cancel",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             height=40,
             command=self.destroy,
             fg_color=("gray70", "gray30")
-        ).pack(side="left", expand=True, fill="x", padx=(5, 0))
+        )
+        self.cancel_btn.pack(side="left", expand=True, fill="x", padx=(5, 0))
+
+        self._save_q = queue.Queue()
 
     def save_file(self):
+        # Dialog modules are imported on first use to keep startup lean
+        from tkinter import filedialog
+
         save_path = filedialog.asksaveasfilename(
             title="Save Processed Audio",
             defaultextension=".wav",
@@ -94,68 +135,145 @@ class DownloadDialog(ctk.CTkToplevel):
         )
 
         if save_path:
-            if self.processor.save_recording(save_path):
-                messagebox.showinfo("Success", f"Audio saved to:\n{save_path}")
-                self.destroy()
-            else:
-                messagebox.showerror("Error", "Failed to save audio file")
+            # Transcoding a long take takes a while - do it off the Tk thread
+            self.save_btn.configure(state="disabled")
+            self.cancel_btn.configure(state="disabled")
+            self.protocol("WM_DELETE_WINDOW", lambda: None)
+            self.info_label.configure(text="Saving...")
+            threading.Thread(target=self._run_save, args=(save_path,), daemon=True).start()
+            self.after(50, self._poll_save)
+
+    def _run_save(self, save_path: str):
+        """Worker thread: write the take, report back through the queue"""
+        self._save_q.put((save_path, self.processor.save_recording(save_path)))
+
+    def _poll_save(self):
+        """Wait on the Tk thread for the save worker to finish"""
+        from tkinter import messagebox
+
+        try:
+            save_path, saved = self._save_q.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_save)
+            return
+
+        if saved:
+            messagebox.showinfo("Success", f"Audio saved to:\n{save_path}")
+            self.destroy()
+        else:
+            self.save_btn.configure(state="normal")
+            self.cancel_btn.configure(state="normal")
+            self.protocol("WM_DELETE_WINDOW", self.destroy)
+            duration = self.processor.recorded_frames / self.processor.samplerate
+            self.info_label.configure(text=f"Duration: {duration:.1f} seconds")
+            messagebox.showerror("Error", "Failed to save audio file")
+
+
+@dataclass(eq=False)
+class EffectSlot:
+    """One effect in the chain - the data model behind an EffectCard"""
+    effect_name: str
+    parameters: MutableMapping[str, float] = field(default_factory=dict)
+    # The effect's (lo, hi, default) specs, looked up once per slot
+    spec: Mapping = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.spec = EFFECTS[self.effect_name]
+
+    @classmethod
+    def with_defaults(cls, effect_name: str) -> "EffectSlot":
+        # Edits land in the front dict; untouched parameters read through
+        # to the backend's shared defaults
+        return cls(effect_name, ChainMap({}, DEFAULT_PARAMETERS[effect_name]))
 
 
 class EffectCard(ctk.CTkFrame):
-    """Visual card for an effect in the chain"""
+    """Reusable visual card, rebound to whichever EffectSlot is in its row"""
 
-    def __init__(self, parent, effect_name: str, on_remove, on_select, on_move_up, on_move_down):
+    def __init__(self, parent, on_remove, on_select, on_move_up, on_move_down):
         super().__init__(parent, fg_color=("gray85", "gray25"), corner_radius=8)
 
-        self.effect_name = effect_name
-        self.parameters = {}
-
-        # Initialize default parameters from the backend dictionary
-        for param, (min_val, max_val, default) in EFFECTS[effect_name].items():
-            self.parameters[param] = default
+        self.slot: Optional[EffectSlot] = None
 
         self.grid_columnconfigure(1, weight=1)
 
         # Effect name
-        ctk.CTkLabel(
-            self, text=effect_name,
-            font=ctk.CTkFont(size=14, weight="bold")
-        ).grid(row=0, column=0, columnspan=4, padx=10, pady=(10, 5), sticky="w")
+        self.name_label = ctk.CTkLabel(
+            self, text="",
+            font=_font(14, "bold")
+        )
+        self.name_label.grid(row=0, column=0, columnspan=4, padx=10, pady=(10, 5), sticky="w")
 
         # Buttons
         ctk.CTkButton(
-            self, text="↑", width=30, command=lambda: on_move_up(self),
+            self, text="↑", width=30, command=lambda: on_move_up(self.slot),
             fg_color=("gray75", "gray30")
         ).grid(row=1, column=0, padx=(10, 2), pady=5)
 
         ctk.CTkButton(
-            self, text="↓", width=30, command=lambda: on_move_down(self),
+            self, text="↓", width=30, command=lambda: on_move_down(self.slot),
             fg_color=("gray75", "gray30")
         ).grid(row=1, column=1, padx=2, pady=5)
 
         ctk.CTkButton(
-            self, text="Edit", width=60, command=lambda: on_select(self),
+            self, text="Edit", width=60, command=lambda: on_select(self.slot),
             fg_color=("#3b8ed0", "#1f6aa5")
         ).grid(row=1, column=2, padx=5, pady=5)
 
         ctk.CTkButton(
-            self, text="Remove", width=70, command=lambda: on_remove(self),
+            self, text="Remove", width=70, command=lambda: on_remove(self.slot),
             fg_color=("#d9534f", "#c9302c")
         ).grid(row=1, column=3, padx=(5, 10), pady=5)
 
+    def bind_to(self, slot: EffectSlot):
+        """Show a slot in this card - only reconfigures, never re-packs"""
+        if slot is not self.slot:
+            self.slot = slot
+            self.name_label.configure(text=slot.effect_name)
+
 
 class RealTimeAudioApp(ctk.CTk):
     """Main application window"""
 
+    # Size of the card widget pool; the chain list only ever mounts this many
+    VISIBLE_CARDS = 10
+    # Available effects panel, pre-flattened to (category, effect) pairs
+    EFFECT_CATEGORIES = (
+        ("Guitar Effects", "Chorus"), ("Guitar Effects", "Distortion"),
+        ("Guitar Effects", "Phaser"), ("Guitar Effects", "Clipping"),
+        ("Dynamics", "Compressor"), ("Dynamics", "Gain"), ("Dynamics", "Limiter"),
+        ("Filters", "HighpassFilter"), ("Filters", "LowpassFilter"),
+        ("Spatial", "Delay"), ("Spatial", "Reverb"),
+        ("Pitch", "PitchShift"),
+        ("Quality", "Bitcrush")
+    )
+    # Longest parameter list of any effect = size of the parameter row pool
+    MAX_PARAMS = max(len(names) for names, *_ in EFFECTS_SOA.values())
+
     def __init__(self):
         super().__init__()
 
         self.title("Real-Time Audio Effect Processor")
         self.geometry("1200x750")
 
-        self.effect_chain: List[EffectCard] = []
-        self.selected_card: Optional[EffectCard] = None
+        self.effect_chain: List[EffectSlot] = []
+        self.selected_slot: Optional[EffectSlot] = None
+        self._card_widgets: List[EffectCard] = []
+        self._first_visible = 0
+        self._visible_rows = self.VISIBLE_CARDS
+        self._cards_packed = 0
+
+        # Slider label refreshes are coalesced into one idle callback
+        self._pending_labels = {}
+        self._pending_label_update = None
+        # Slider values waiting to be pushed to the processor
+        self._pending_params = {}
+        self._pending_update = None
+        # Value currently shown per parameter, rounded to the label's precision
+        self._last_displayed = {}
         self.input_file = None
+        # Parsed once when the file is picked, reused for every status label
+        self._input_name: Optional[str] = None
 
         # Audio processing
         self.processor = RealTimeAudioProcessor()
@@ -163,8 +281,14 @@ class RealTimeAudioApp(ctk.CTk):
         self.playback_session: Optional[FilePlaybackSession] = None
         self.is_active = False
 
+        # Results from background workers, drained on the Tk thread
+        self._result_q = queue.Queue()
+
         self.setup_ui()
         self.update_effect_chain()
+        self.after(50, self._poll_results)
+        self._status_seen = (0, 0)
+        self.after(500, self._poll_audio_status)
 
     def setup_ui(self):
         self.grid_columnconfigure(1, weight=1)
@@ -192,7 +316,7 @@ class RealTimeAudioApp(ctk.CTk):
             anchor="w",
             fg_color=("gray85", "gray25"),
             corner_radius=6,
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         self.status_label.grid(row=0, column=2, padx=5, sticky="ew")
 
@@ -207,7 +331,7 @@ class RealTimeAudioApp(ctk.CTk):
             width=100,
             command=self.browse_file,
             fg_color=("#3b8ed0", "#1f6aa5"),
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         # Not packed initially
 
@@ -218,7 +342,7 @@ class RealTimeAudioApp(ctk.CTk):
             width=150,
             command=self.toggle_audio,
             fg_color=("#2ecc71", "#27ae60"),
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=_font(13, "bold")
         )
         self.start_btn.pack(side="left", padx=2)
 
@@ -229,7 +353,7 @@ class RealTimeAudioApp(ctk.CTk):
             width=120,
             command=self.download_audio,
             fg_color=("#3b8ed0", "#1f6aa5"),
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=_font(13, "bold")
         )
 
         # Left panel: Available effects
@@ -239,32 +363,27 @@ class RealTimeAudioApp(ctk.CTk):
 
         ctk.CTkLabel(
             left_panel, text="Available Effects",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(padx=10, pady=10)
 
         scroll_frame = ctk.CTkScrollableFrame(left_panel)
         scroll_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
-        categories = {
-            "Guitar Effects": ["Chorus", "Distortion", "Phaser", "Clipping"],
-            "Dynamics": ["Compressor", "Gain", "Limiter"],
-            "Filters": ["HighpassFilter", "LowpassFilter"],
-            "Spatial": ["Delay", "Reverb"],
-            "Pitch": ["PitchShift"],
-            "Quality": ["Bitcrush"]
-        }
-
-        for category, effects in categories.items():
-            ctk.CTkLabel(
-                scroll_frame, text=category,
-                font=ctk.CTkFont(size=12, weight="bold"), anchor="w"
-            ).pack(fill="x", padx=5, pady=(10, 5))
-
-            for effect in effects:
-                ctk.CTkButton(
-                    scroll_frame, text=f"+ {effect}",
-                    command=lambda e=effect: self.add_effect(e), anchor="w"
-                ).pack(fill="x", padx=5, pady=2)
+        # One shared click handler; each button is looked up by widget
+        self._effect_for_widget = {}
+        previous_category = None
+        for category, effect in self.EFFECT_CATEGORIES:
+            if category != previous_category:
+                ctk.CTkLabel(
+                    scroll_frame, text=category,
+                    font=_font(12, "bold"), anchor="w"
+                ).pack(fill="x", padx=5, pady=(10, 5))
+                previous_category = category
+
+            button = ctk.CTkButton(scroll_frame, text=f"+ {effect}", anchor="w")
+            button.bind("<Button-1>", self.on_add_click)
+            button.pack(fill="x", padx=5, pady=2)
+            self._effect_for_widget[button] = effect
 
         # Middle panel: Effect chain
         middle_panel = ctk.CTkFrame(self)
@@ -275,25 +394,48 @@ class RealTimeAudioApp(ctk.CTk):
 
         ctk.CTkLabel(
             header_frame, text="Effect Chain (Signal Flow →)",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(side="left")
 
         # Live indicator
         self.live_indicator = ctk.CTkLabel(
             header_frame,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="#e74c3c"
         )
         self.live_indicator.pack(side="right", padx=10)
 
-        self.chain_frame = ctk.CTkScrollableFrame(middle_panel)
-        self.chain_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        # Virtualized chain list: a fixed pool of cards is rebound to the
+        # slots in the viewport instead of mounting one widget per effect
+        chain_body = ctk.CTkFrame(middle_panel)
+        chain_body.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        self.chain_scrollbar = ctk.CTkScrollbar(chain_body, command=self.on_chain_scroll)
+        self.chain_scrollbar.pack(side="right", fill="y", padx=(0, 2), pady=2)
+
+        self.chain_frame = ctk.CTkFrame(chain_body, fg_color="transparent")
+        self.chain_frame.pack(side="left", fill="both", expand=True)
+        self.chain_frame.pack_propagate(False)
+        self.chain_frame.bind("<Configure>", self.on_chain_resize)
+
+        self._card_widgets = [
+            EffectCard(
+                self.chain_frame,
+                on_remove=self.remove_effect, on_select=self.select_effect,
+                on_move_up=self.move_effect_up, on_move_down=self.move_effect_down
+            )
+            for _ in range(self.VISIBLE_CARDS)
+        ]
+
+        self.bind_all("<MouseWheel>", self.on_chain_mousewheel, add="+")
+        self.bind_all("<Button-4>", self.on_chain_mousewheel, add="+")
+        self.bind_all("<Button-5>", self.on_chain_mousewheel, add="+")
 
         self.empty_label = ctk.CTkLabel(
             self.chain_frame,
             text="No effects added.\nAdd effects from the left - they'll apply in real-time!",
-            font=ctk.CTkFont(size=14), text_color="gray"
+            font=_font(14), text_color="gray"
         )
         self.empty_label.pack(expand=True, pady=50)
 
@@ -304,25 +446,49 @@ class RealTimeAudioApp(ctk.CTk):
 
         ctk.CTkLabel(
             right_panel, text="Effect Parameters",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(padx=10, pady=10)
 
         ctk.CTkLabel(
             right_panel, text="Changes apply instantly!",
-            font=ctk.CTkFont(size=11), text_color="#2ecc71"
+            font=_font(11), text_color="#2ecc71"
         ).pack(padx=10, pady=(0, 5))
 
         self.params_frame = ctk.CTkScrollableFrame(right_panel)
         self.params_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
-        self.param_widgets = {}
         self.params_empty_label = ctk.CTkLabel(
             self.params_frame,
             text="Select an effect to edit\nits parameters",
-            font=ctk.CTkFont(size=14), text_color="gray"
+            font=_font(14), text_color="gray"
         )
         self.params_empty_label.pack(expand=True, pady=50)
 
+        # Parameter widgets are built once and reconfigured per selection
+        self.params_title = ctk.CTkLabel(
+            self.params_frame, text="",
+            font=_font(16, "bold")
+        )
+        self._param_rows = [self._build_param_row() for _ in range(self.MAX_PARAMS)]
+
+    def _build_param_row(self) -> dict:
+        """Create one hidden label/value/slider row for the parameter pool"""
+        frame = ctk.CTkFrame(self.params_frame, fg_color="transparent")
+
+        label = ctk.CTkLabel(frame, text="", font=_font(12))
+        label.pack(anchor="w")
+
+        value_label = ctk.CTkLabel(
+            frame, text="",
+            font=_font(11), text_color="gray"
+        )
+        value_label.pack(anchor="w")
+
+        slider = ctk.CTkSlider(frame)
+        slider.pack(fill="x", pady=(5, 0))
+
+        return {"frame": frame, "label": label, "value_label": value_label, "slider": slider}
+
     def on_mode_change(self, value):
         """Handle mode change"""
         if self.is_active:
@@ -337,7 +503,7 @@ class RealTimeAudioApp(ctk.CTk):
             self.change_file_btn.pack(side="left", padx=(0, 5), before=self.start_btn)
 
             if self.input_file:
-                self.status_label.configure(text=f"📁 Ready to play: {Path(self.input_file).name}")
+                self.status_label.configure(text=f"📁 Ready to play: {self._input_name}")
                 self.start_btn.configure(text="▶ Start Playback")
             else:
                 self.status_label.configure(text="📁 Select a file to play with live effects")
@@ -345,13 +511,16 @@ class RealTimeAudioApp(ctk.CTk):
 
     def browse_file(self):
         """Open file dialog to select input file"""
+        from tkinter import filedialog
+
         filename = filedialog.askopenfilename(
             title="Select Audio File",
             filetypes=[("Audio Files", "*.wav *.mp3 *.flac *.ogg"), ("All Files", "*.*")]
         )
         if filename:
             self.input_file = filename
-            self.status_label.configure(text=f"📁 Ready to play: {Path(self.input_file).name}")
+            self._input_name = Path(filename).name
+            self.status_label.configure(text=f"📁 Ready to play: {self._input_name}")
             self.start_btn.configure(text="▶ Start Playback")
 
             # If we were playing, stop
@@ -370,6 +539,9 @@ class RealTimeAudioApp(ctk.CTk):
         mode = self.mode_selector.get()
 
         if mode == "Record Live":
+            # A new session replaces the take; it can only be saved once stopped
+            self.download_btn.pack_forget()
+
             # Start live recording
             self.live_session = LiveRecordingSession(self.processor)
             self.live_session.start()
@@ -390,24 +562,88 @@ class RealTimeAudioApp(ctk.CTk):
                 if not self.input_file:
                     return
 
-            # Start playback
+            self.download_btn.pack_forget()
+
+            # Decode the file on a worker thread; playback starts once
+            # _poll_results picks up the result on the Tk thread
             self.playback_session = FilePlaybackSession(self.processor, self.input_file)
-            if self.playback_session.start():
-                self.is_active = True
+            self.status_label.configure(text=f"⏳ Loading: {self._input_name}")
+            self.start_btn.configure(state="disabled")
+            self.mode_selector.configure(state="disabled")
+            self.change_file_btn.configure(state="disabled")
 
-                self.status_label.configure(text=f"▶ Playing: {Path(self.input_file).name}")
-                self.start_btn.configure(
-                    text="⏹ Stop Playback",
-                    fg_color=("#e74c3c", "#c0392b")
-                )
-                self.live_indicator.configure(text="● LIVE")
-                self.mode_selector.configure(state="disabled")
-                self.change_file_btn.configure(state="disabled")
+            threading.Thread(
+                target=self._run_load, args=(self.playback_session,), daemon=True
+            ).start()
+
+    def _run_load(self, session: FilePlaybackSession):
+        """Worker thread: load the playback file, report back through the queue"""
+        self._result_q.put(("loaded", session, session.load_file()))
+
+    def _poll_results(self):
+        """Drain worker results on the Tk thread"""
+        try:
+            while True:
+                kind, *payload = self._result_q.get_nowait()
+                if kind == "loaded":
+                    self._on_file_loaded(*payload)
+        except queue.Empty:
+            pass
+        finally:
+            # A failing handler must not stop the pump for later results
+            self.after(50, self._poll_results)
+
+    def _poll_audio_status(self):
+        """Surface stream status flags reported by the audio callback"""
+        count = self.processor.status_count
+        overruns = self.processor.recording_overruns
+        if (count, overruns) != self._status_seen:
+            self._status_seen = (count, overruns)
+            if self.is_active and (count or overruns):
+                if count:
+                    print(f"Status: {self.processor.last_status}")
+                text = f"● LIVE · {count} dropouts"
+                if overruns:
+                    text += f" · {overruns} blocks lost"
+                self.live_indicator.configure(text=text)
+
+        self.after(500, self._poll_audio_status)
+
+    def _on_file_loaded(self, session: FilePlaybackSession, loaded: bool):
+        """Start playback once the worker has decoded the file"""
+        self.start_btn.configure(state="normal")
+
+        started = False
+        if loaded:
+            try:
+                started = session.start()
+            except Exception as e:
+                # e.g. PortAudio can't open the output device
+                print(f"Playback error: {e}")
+                session.stop()
+
+        if started:
+            self.is_active = True
 
-                # Monitor playback completion
-                self.monitor_playback()
-            else:
-                messagebox.showerror("Error", "Failed to load audio file")
+            self.status_label.configure(text=f"▶ Playing: {self._input_name}")
+            self.start_btn.configure(
+                text="⏹ Stop Playback",
+                fg_color=("#e74c3c", "#c0392b")
+            )
+            self.live_indicator.configure(text="● LIVE")
+
+            # Monitor playback completion
+            self.monitor_playback()
+        else:
+            from tkinter import messagebox
+
+            self.playback_session = None
+            self.status_label.configure(text=f"📁 Ready to play: {self._input_name}")
+            self.mode_selector.configure(state="normal")
+            self.change_file_btn.configure(state="normal")
+            if self.processor.recorded_frames:
+                self.download_btn.pack(side="left", padx=2)
+            messagebox.showerror("Error", "Failed to load audio file")
 
     def stop_audio(self):
         """Stop audio processing"""
@@ -431,7 +667,7 @@ class RealTimeAudioApp(ctk.CTk):
             )
             self.change_file_btn.configure(state="normal")
         else:
-            self.status_label.configure(text=f"✅ Playback stopped - Ready: {Path(self.input_file).name}")
+            self.status_label.configure(text=f"✅ Playback stopped - Ready: {self._input_name}")
             self.start_btn.configure(
                 text="▶ Play Again",
                 fg_color=("#2ecc71", "#27ae60")
@@ -442,139 +678,232 @@ class RealTimeAudioApp(ctk.CTk):
         self.mode_selector.configure(state="normal")
 
         # Show download button if we have audio
-        if self.processor.recorded_chunks:
+        if self.processor.recorded_frames:
             self.download_btn.pack(side="left", padx=2)
 
     def monitor_playback(self):
         """Monitor playback session for completion"""
         if self.playback_session and not self.playback_session.is_running:
+            error = self.playback_session.error
             self.stop_audio()
+            if error is not None:
+                from tkinter import messagebox
+                messagebox.showerror("Error", f"Playback failed:\n{error}")
         elif self.is_active:
             self.after(100, self.monitor_playback)
 
     def download_audio(self):
         """Download processed audio"""
-        if self.processor.recorded_chunks:
+        if self.processor.recorded_frames:
             DownloadDialog(self, self.processor)
 
+    def on_add_click(self, event):
+        """Shared handler for the Available Effects buttons"""
+        # CTkButton forwards clicks from its inner canvas/label, whose master is the button
+        self.add_effect(self._effect_for_widget[event.widget.master])
+
     def add_effect(self, effect_name: str):
-        card = EffectCard(
-            self.chain_frame, effect_name,
-            on_remove=self.remove_effect, on_select=self.select_effect,
-            on_move_up=self.move_effect_up, on_move_down=self.move_effect_down
-        )
-        card.pack(fill="x", padx=5, pady=5)
-        self.effect_chain.append(card)
+        self.effect_chain.append(EffectSlot.with_defaults(effect_name))
         if self.empty_label.winfo_exists():
             self.empty_label.pack_forget()
 
+        # Scroll so the new effect is in view
+        self._first_visible = len(self.effect_chain) - self._visible_rows
+        self.repaint_visible()
         self.update_effect_chain()
 
-    def remove_effect(self, card: EffectCard):
-        if card in self.effect_chain:
-            self.effect_chain.remove(card)
-            card.destroy()
+    def remove_effect(self, slot: EffectSlot):
+        if slot in self.effect_chain:
+            self.effect_chain.remove(slot)
 
-            if self.selected_card == card:
+            if self.selected_slot == slot:
                 self.clear_parameters()
 
             if not self.effect_chain:
                 self.empty_label.pack(expand=True, pady=50)
 
+            self.repaint_visible()
             self.update_effect_chain()
 
-    def move_effect_up(self, card: EffectCard):
-        idx = self.effect_chain.index(card)
+    def move_effect_up(self, slot: EffectSlot):
+        idx = self.effect_chain.index(slot)
         if idx > 0:
             self.effect_chain[idx], self.effect_chain[idx-1] = self.effect_chain[idx-1], self.effect_chain[idx]
-            self.refresh_chain_display()
+            self.repaint_visible()
             self.update_effect_chain()
 
-    def move_effect_down(self, card: EffectCard):
-        idx = self.effect_chain.index(card)
+    def move_effect_down(self, slot: EffectSlot):
+        idx = self.effect_chain.index(slot)
         if idx < len(self.effect_chain) - 1:
             self.effect_chain[idx], self.effect_chain[idx+1] = self.effect_chain[idx+1], self.effect_chain[idx]
-            self.refresh_chain_display()
+            self.repaint_visible()
             self.update_effect_chain()
 
-    def refresh_chain_display(self):
-        for card in self.effect_chain:
-            card.pack_forget()
-        for card in self.effect_chain:
-            card.pack(fill="x", padx=5, pady=5)
+    def repaint_visible(self):
+        """Rebind the card pool to the slots currently in the viewport"""
+        count = len(self.effect_chain)
+        rows = self._visible_rows
+        self._first_visible = max(0, min(self._first_visible, count - rows))
+
+        shown = min(rows, count - self._first_visible)
+        for i in range(shown):
+            self._card_widgets[i].bind_to(self.effect_chain[self._first_visible + i])
+
+        if shown != self._cards_packed:
+            # Several rows may appear/disappear at once (first fill, resize),
+            # so toggle them with the list unmapped
+            if abs(shown - self._cards_packed) > 1:
+                layout = _held_layout(self.chain_frame, side="left", fill="both", expand=True)
+            else:
+                layout = contextlib.nullcontext()
+            with layout:
+                # Rows are only ever shown/hidden as a suffix, so packing in
+                # pool order keeps the on-screen order intact
+                for widget in self._card_widgets[self._cards_packed:shown]:
+                    widget.pack(fill="x", padx=5, pady=5)
+                for widget in self._card_widgets[shown:self._cards_packed]:
+                    widget.pack_forget()
+            self._cards_packed = shown
+
+        if count:
+            self.chain_scrollbar.set(self._first_visible / count, (self._first_visible + shown) / count)
+        else:
+            self.chain_scrollbar.set(0.0, 1.0)
+
+    def on_chain_resize(self, event):
+        """Recompute how many card rows fit in the chain viewport"""
+        card_height = self._card_widgets[0].winfo_reqheight() + 10  # pady=5 on each side
+        rows = max(1, min(self.VISIBLE_CARDS, event.height // card_height))
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self.repaint_visible()
+
+    def on_chain_scroll(self, action, value, unit=None):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units')"""
+        if action == "moveto":
+            self._first_visible = round(float(value) * len(self.effect_chain))
+        else:
+            self._first_visible += int(value)
+        self.repaint_visible()
+
+    def on_chain_mousewheel(self, event):
+        """Scroll the chain by one card per wheel step while the pointer is over it"""
+        chain_path = str(self.chain_frame)
+        widget_path = str(event.widget)
+        if widget_path != chain_path and not widget_path.startswith(chain_path + "."):
+            return
+
+        if event.num == 4 or event.delta > 0:
+            self._first_visible -= 1
+        else:
+            self._first_visible += 1
+        self.repaint_visible()
 
     def update_effect_chain(self):
         """Update processor with current effect chain"""
         config = [
-            {"name": card.effect_name, "parameters": card.parameters.copy()}
-            for card in self.effect_chain
+            {"name": slot.effect_name, "parameters": slot.parameters}
+            for slot in self.effect_chain
         ]
-        self.processor.update_effects(config)
+        if not self.processor.update_effects(config):
+            from tkinter import messagebox
+            messagebox.showerror("Error", "Failed to update the effect chain")
 
-    def select_effect(self, card: EffectCard):
-        self.selected_card = card
-        self.display_parameters(card)
+    def select_effect(self, slot: EffectSlot):
+        self.selected_slot = slot
+        self.display_parameters(slot)
 
     def clear_parameters(self):
-        for widget in list(self.params_frame.winfo_children()):
-            widget.destroy()
+        # Drop label refreshes aimed at rows that are about to be reused
+        self._pending_labels.clear()
+        self.selected_slot = None
 
-        self.param_widgets.clear()
-        self.selected_card = None
+        self.params_title.pack_forget()
+        for row in self._param_rows:
+            row["frame"].pack_forget()
 
-        self.params_empty_label = ctk.CTkLabel(
-            self.params_frame,
-            text="Select an effect to edit\nits parameters",
-            font=ctk.CTkFont(size=14), text_color="gray"
-        )
         self.params_empty_label.pack(expand=True, pady=50)
 
-    def display_parameters(self, card: EffectCard):
-        for widget in list(self.params_frame.winfo_children()):
-            widget.destroy()
-
-        self.param_widgets.clear()
-
-        ctk.CTkLabel(
-            self.params_frame,
-            text=f"🎛️ {card.effect_name}",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(pady=(0, 20))
-
-        params = EFFECTS[card.effect_name]
-        for param_name, (min_val, max_val, default) in params.items():
-            frame = ctk.CTkFrame(self.params_frame, fg_color="transparent")
-            frame.pack(fill="x", pady=10)
-
-            ctk.CTkLabel(
-                frame, text=param_name.replace("_", " ").title(),
-                font=ctk.CTkFont(size=12)
-            ).pack(anchor="w")
-
-            value_label = ctk.CTkLabel(
-                frame, text=f"{card.parameters[param_name]:.2f}",
-                font=ctk.CTkFont(size=11), text_color="gray"
-            )
-            value_label.pack(anchor="w")
-
-            slider = ctk.CTkSlider(
-                frame, from_=min_val, to=max_val,
-                command=lambda val, p=param_name, vl=value_label, c=card:
-                    self.update_parameter(c, p, val, vl)
+    def display_parameters(self, slot: EffectSlot):
+        self._pending_labels.clear()
+        self._last_displayed.clear()
+
+        names, mins, maxs, _, labels = EFFECTS_SOA[slot.effect_name]
+        for i, param_name in enumerate(names):
+            row = self._param_rows[i]
+            row["label"].configure(text=labels[i])
+            shown = round(slot.parameters[param_name], 2)
+            self._last_displayed[param_name] = shown
+            row["value_label"].configure(text=format(shown, ".2f"))
+
+            slider = row["slider"]
+            slider.configure(
+                from_=mins[i], to=maxs[i],
+                # partial runs in C - one Python frame per tick instead of two
+                command=functools.partial(
+                    self.update_parameter, slot, param_name, value_label=row["value_label"]
+                )
             )
-            slider.set(card.parameters[param_name])
-            slider.pack(fill="x", pady=(5, 0))
-
-            self.param_widgets[param_name] = {
-                "frame": frame, "slider": slider, "value_label": value_label
-            }
+            slider.set(slot.parameters[param_name])
 
-    def update_parameter(self, card: EffectCard, param_name: str, value: float, value_label: ctk.CTkLabel):
-        card.parameters[param_name] = value
-        value_label.configure(text=f"{value:.2f}")
+        self.params_title.configure(text=f"🎛️ {slot.effect_name}")
 
-        # Update effect chain in real-time
-        self.update_effect_chain()
+        # Coming from the empty panel the title and every row get packed, so
+        # do it with the panel unmapped; switching effects only toggles a few
+        if self.params_title.winfo_manager():
+            layout = contextlib.nullcontext()
+        else:
+            layout = _held_layout(self.params_frame, fill="both", expand=True, padx=10, pady=(0, 10))
+        with layout:
+            self.params_empty_label.pack_forget()
+            if not self.params_title.winfo_manager():
+                self.params_title.pack(pady=(0, 20))
+
+            # Rows are hidden as a suffix, so packing in order keeps the layout
+            for i, row in enumerate(self._param_rows):
+                if i < len(names):
+                    if not row["frame"].winfo_manager():
+                        row["frame"].pack(fill="x", pady=10)
+                elif row["frame"].winfo_manager():
+                    row["frame"].pack_forget()
+
+    def update_parameter(self, slot: EffectSlot, param_name: str, value: float, value_label: ctk.CTkLabel):
+        spec = slot.spec[param_name]
+        value = min(max(value, spec.lo), spec.hi)
+        slot.parameters[param_name] = value
+
+        # Drag fires this per pixel - only the latest value reaches the label,
+        # and only when it changes at the displayed precision
+        if round(value, 2) != self._last_displayed.get(param_name):
+            self._pending_labels[param_name] = (slot, value_label)
+            if self._pending_label_update is None:
+                self._pending_label_update = self.after_idle(self._flush_param_labels)
+
+        # Push to the live plugin on a short trailing-edge timer so a drag
+        # sends only its latest value
+        self._pending_params[param_name] = slot
+        if self._pending_update is None:
+            self._pending_update = self.after(15, self._flush_update)
+
+    def _flush_update(self):
+        """Apply the latest dragged values to the processor"""
+        self._pending_update = None
+        for param_name, slot in self._pending_params.items():
+            # The effect may have been removed while the timer was pending
+            if slot in self.effect_chain:
+                index = self.effect_chain.index(slot)
+                self.processor.set_param(index, param_name, slot.parameters[param_name])
+        self._pending_params.clear()
+
+    def _flush_param_labels(self):
+        """Write the current value of every dragged parameter to its label"""
+        self._pending_label_update = None
+        for param_name, (slot, value_label) in self._pending_labels.items():
+            shown = round(slot.parameters[param_name], 2)
+            if shown != self._last_displayed.get(param_name):
+                self._last_displayed[param_name] = shown
+                value_label.configure(text=format(shown, ".2f"))
+        self._pending_labels.clear()
 
 
 if __name__ == "__main__":
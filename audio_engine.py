@@ -4,10 +4,18 @@ Backend logic for Real-Time Audio Application.
 Handles Pedalboard effects, SoundDevice streams, and audio processing.
 """
 
+import atexit
+import os
+import shutil
+import tempfile
 import threading
+import time
+from collections import OrderedDict, namedtuple
+from types import MappingProxyType
 import sounddevice as sd
 import soundfile as sf
 import numpy as np
+from pathlib import Path
 from typing import Dict, List, Optional
 
 # Audio processing imports
@@ -19,8 +27,13 @@ from pedalboard import (
     Delay, Reverb, PitchShift, Bitcrush
 )
 
+from audio_kernels import ScalarChain, warm_up as warm_up_kernels
+
+# (min, max, default) for one effect parameter
+ParamSpec = namedtuple("ParamSpec", "lo hi default")
+
 # Effect definitions - Adjusted for cleaner default sound
-EFFECTS = {
+_EFFECT_TABLE = {
     "Chorus": {
         "rate_hz": (0.1, 10.0, 1.0),
         "depth": (0.0, 1.0, 0.25),
@@ -80,10 +93,121 @@ EFFECTS = {
     }
 }
 
+# Read-only view of the table so nothing can mutate the shared definitions
+EFFECTS = MappingProxyType({
+    effect_name: MappingProxyType({
+        param: ParamSpec(*spec) for param, spec in params.items()
+    })
+    for effect_name, params in _EFFECT_TABLE.items()
+})
+
+# Shared read-only default parameters per effect, layered under per-slot edits
+DEFAULT_PARAMETERS = MappingProxyType({
+    effect_name: MappingProxyType({
+        param: spec.default for param, spec in params.items()
+    })
+    for effect_name, params in EFFECTS.items()
+})
+
+# Same table flattened per effect into parallel tuples:
+# (param names, mins, maxs, defaults, display labels)
+EFFECTS_SOA = {
+    effect_name: (
+        tuple(params),
+        tuple(spec.lo for spec in params.values()),
+        tuple(spec.hi for spec in params.values()),
+        tuple(spec.default for spec in params.values()),
+        tuple(param.replace("_", " ").title() for param in params)
+    )
+    for effect_name, params in EFFECTS.items()
+}
+
+
+class RecordingWriter:
+    """Streams recorded blocks to a temporary float WAV on a background thread.
+
+    The audio thread (single producer) copies each block into a slot of a
+    preallocated ring and bumps the write index; the writer thread (single
+    consumer) drains slots to disk and bumps the read index. Each index has
+    one writer, so no locks or allocations are needed on the audio path.
+    """
+
+    # The engine is float32 end-to-end, so takes are stored without requantizing
+    SUBTYPE = "FLOAT"
+    # Ring capacity in blocks (~1.5 s at 256 frames / 44.1 kHz) and how long
+    # the writer sleeps when it has caught up
+    RING_BLOCKS = 256
+    IDLE_SLEEP = 0.01
+
+    def __init__(self, samplerate: int, channels: int, blocksize: int):
+        fd, self.path = tempfile.mkstemp(prefix="pedalboard_take_", suffix=".wav")
+        os.close(fd)
+        self._file = sf.SoundFile(self.path, "w", samplerate, channels, subtype=self.SUBTYPE)
+
+        self._ring = np.empty((self.RING_BLOCKS, blocksize, channels), dtype=np.float32)
+        self._lengths = [0] * self.RING_BLOCKS
+        self._write_index = 0
+        self._read_index = 0
+        self._stopping = False
+
+        self.frames = 0
+        self.overruns = 0
+        self.closed = False
+
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def write(self, block: np.ndarray):
+        """Copy a block into the ring (audio thread, never blocks or allocates)"""
+        if self._write_index - self._read_index >= self.RING_BLOCKS:
+            # Writer fell a full ring behind; the consumer owns the unread
+            # slots, so the incoming block is the one dropped
+            self.overruns += 1
+            return
+
+        slot = self._write_index % self.RING_BLOCKS
+        frames = len(block)
+        self._ring[slot, :frames] = block
+        self._lengths[slot] = frames
+        # Publish only after the slot is filled
+        self._write_index += 1
+        self.frames += frames
+
+    def _drain(self):
+        while True:
+            if self._read_index == self._write_index:
+                if self._stopping:
+                    break
+                time.sleep(self.IDLE_SLEEP)
+                continue
+
+            slot = self._read_index % self.RING_BLOCKS
+            self._file.write(self._ring[slot, :self._lengths[slot]])
+            self._read_index += 1
+        self._file.close()
+
+    def close(self):
+        """Flush everything written so far and close the file"""
+        if not self.closed:
+            self.closed = True
+            self._stopping = True
+            self._thread.join()
+
+    def discard(self):
+        """Close and delete the temporary file"""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
 
 class RealTimeAudioProcessor:
     """Real-time audio processor with live effects"""
 
+    # Retired plugin instances kept around for reuse when a chain is rebuilt
+    PLUGIN_CACHE_SIZE = 64
+
     EFFECT_MAP = {
         "Chorus": Chorus, "Distortion": Distortion, "Phaser": Phaser,
         "Clipping": Clipping, "Compressor": Compressor, "Gain": Gain,
@@ -92,54 +216,284 @@ class RealTimeAudioProcessor:
         "PitchShift": PitchShift, "Bitcrush": Bitcrush
     }
 
-    def __init__(self, samplerate=44100):
+    # Sample formats used when a take is exported to something other than WAV
+    # (WAV exports are the FLOAT take itself)
+    EXPORT_SUBTYPES = {".flac": "PCM_24", ".ogg": "VORBIS"}
+
+    def __init__(self, samplerate=44100, blocksize=256, channels=2, latency="low"):
         self.samplerate = samplerate
+        # Fixed block size and latency hint shared by every stream, so the
+        # preallocated buffers below always match what PortAudio delivers
+        self.blocksize = blocksize
+        self.channels = channels
+        self.latency = latency
+        # Double-buffered chain: the GUI publishes _pending_board, the audio
+        # thread adopts it as self.board at the start of the next chunk
         self.board = Pedalboard([])
-        # Safety limiter prevents clipping at the output stage
+        self._pending_board = self.board
+        self._board_len = 0
+        # Effect names and last-applied parameters of the published chain, so
+        # parameter-only updates can be applied to the live plugins in place
+        self._chain_names = ()
+        self._chain_params: List[Dict] = []
+        # Plugin instances of the published board (empty for a fused chain) and
+        # recently retired ones, keyed by (name, sorted params) for reuse
+        self._plugins = []
+        self._plugin_cache: "OrderedDict[tuple, list]" = OrderedDict()
+        # (key, plugins) dropped from a chain the audio thread may still be
+        # running; they reach the cache only once it has adopted a newer board
+        self._retired: List[tuple] = []
+        # Safety limiter prevents clipping at the output stage; one instance is
+        # shared by every chain so its envelope survives rebuilds
         self.safety_limiter = Limiter(threshold_db=-1.0, release_ms=100.0)
-        self.lock = threading.Lock()
         self.is_active = False
-        self.recorded_chunks = []
-
-    def update_effects(self, effect_configs: List[Dict]):
-        """Thread-safe effect chain update"""
-        with self.lock:
-            new_board = Pedalboard([])
-            for effect_config in effect_configs:
-                effect_class = self.EFFECT_MAP[effect_config["name"]]
-                effect = effect_class(**effect_config["parameters"])
-                new_board.append(effect)
-
-            self.board = new_board
-
-    def process_chunk(self, audio_chunk: np.ndarray) -> np.ndarray:
-        """Process a chunk of audio through the effect chain"""
-        with self.lock:
-            # Ensure input is float32
-            if audio_chunk.dtype != np.float32:
-                audio_chunk = audio_chunk.astype(np.float32)
-
-            if len(self.board) > 0:
-                try:
-                    # reset=False keeps delay/reverb trails between chunks
-                    processed = self.board(audio_chunk.T, self.samplerate, reset=False)
-                    processed = processed.T
-
-                    # Apply safety limiter
-                    processed = self.safety_limiter(processed, self.samplerate)
-
-                    return processed
-                except Exception as e:
-                    print(f"Processing error: {e}")
-                    return audio_chunk
-            return audio_chunk
+        # Callbacks that reported a PortAudio status (xruns), and the last flags
+        self.status_count = 0
+        self.last_status = None
+
+        # Preallocated channel-major input for Pedalboard, reused every callback.
+        # Kept flat so a short block can be viewed as a C-contiguous
+        # (channels, frames) array instead of a strided slice Pedalboard would copy
+        self._scratch_in = np.zeros(channels * blocksize, dtype=np.float32)
+        self._writer: Optional[RecordingWriter] = None
+        atexit.register(self.discard_recording)
+
+        # Pay JIT compile and plugin first-use costs now rather than on the
+        # first audio callback after an effect is added
+        warm_up_kernels()
+        self._warm_up_plugins()
+
+    def _warm_up_plugins(self):
+        """Instantiate and run every plugin once with its defaults.
+
+        The warmed instances seed the plugin cache, so adding an effect with
+        untouched sliders reuses one instead of constructing a new plugin.
+        """
+        warm_plugins = {
+            name: effect_class(**DEFAULT_PARAMETERS[name])
+            for name, effect_class in self.EFFECT_MAP.items()
+        }
+        Pedalboard(list(warm_plugins.values())).process(
+            np.zeros((self.channels, self.blocksize), dtype=np.float32),
+            self.samplerate
+        )
+        for name, plugin in warm_plugins.items():
+            self._plugin_cache[self._plugin_key(name, DEFAULT_PARAMETERS[name])] = [plugin]
+
+    def update_effects(self, effect_configs: List[Dict]) -> bool:
+        """Thread-safe effect chain update (called from the GUI thread).
+
+        If only parameters changed, the live plugins are updated in place and
+        keep their internal state. Otherwise the new chain is built without any
+        lock and published with a single reference store, which is atomic under
+        the GIL - the audio thread keeps running the old chain until its next chunk.
+
+        Parameters are clamped to their EFFECTS ranges here, so the audio thread
+        never sees a value a plugin could reject. Returns False (and keeps the
+        current chain) if the new chain can't be built.
+        """
+        names = tuple(effect_config["name"] for effect_config in effect_configs)
+        if names == self._chain_names:
+            for index, effect_config in enumerate(effect_configs):
+                applied = self._chain_params[index]
+                for param, value in effect_config["parameters"].items():
+                    if applied[param] != value:
+                        self.set_param(index, param, value)
+            return True
+
+        self._release_retired()
+
+        # Live plugins are up for reuse first - a reorder keeps their state
+        live = {}
+        for name, params, plugin in zip(self._chain_names, self._chain_params, self._plugins):
+            live.setdefault(self._plugin_key(name, params), []).append(plugin)
+
+        try:
+            chain_params = [
+                {
+                    param: self._clamp(effect_config["name"], param, value)
+                    for param, value in effect_config["parameters"].items()
+                }
+                for effect_config in effect_configs
+            ]
+            configs = [
+                {"name": name, "parameters": params} for name, params in zip(names, chain_params)
+            ]
+
+            # Gain/Clipping/Bitcrush/Distortion-only chains run as one fused kernel
+            fast_chain = ScalarChain.from_configs(configs, post=self.safety_limiter)
+            if fast_chain is not None:
+                plugins = []
+                board = fast_chain
+            else:
+                plugins = [
+                    self._take_plugin(name, params, live)
+                    for name, params in zip(names, chain_params)
+                ]
+                # The safety limiter rides along as the last plugin, so one
+                # process() call covers the whole chain
+                board = Pedalboard(plugins + [self.safety_limiter] if plugins else [])
+        except Exception as e:
+            print(f"Error building effect chain: {e}")
+            return False
+
+        self._chain_names = names
+        self._chain_params = chain_params
+        self._plugins = plugins
+        self._pending_board = board
+
+        # Whatever wasn't reused is retired; the audio thread can still be
+        # inside the previous board, so these aren't safe to reset yet
+        self._retired.extend((key, plugins) for key, plugins in live.items() if plugins)
+        return True
+
+    def _release_retired(self):
+        """Move retired plugins into the cache once no running chain can hold them"""
+        if self.is_active and self.board is not self._pending_board:
+            # The callback hasn't adopted the latest board yet
+            return
+        for key, plugins in self._retired:
+            self._plugin_cache.setdefault(key, []).extend(plugins)
+            self._plugin_cache.move_to_end(key)
+        self._retired.clear()
+        while len(self._plugin_cache) > self.PLUGIN_CACHE_SIZE:
+            self._plugin_cache.popitem(last=False)
+
+    @staticmethod
+    def _clamp(name: str, param: str, value: float) -> float:
+        """Limit a parameter value to its range in EFFECTS"""
+        spec = EFFECTS[name][param]
+        return min(max(float(value), spec.lo), spec.hi)
+
+    @staticmethod
+    def _plugin_key(name: str, params: Dict) -> tuple:
+        return name, tuple(sorted(params.items()))
+
+    def _take_plugin(self, name: str, params: Dict, live: Dict):
+        """Reuse a live or cached plugin with these exact parameters, else build one.
+
+        Instances are popped, never shared: plugins are stateful, so the same
+        object must not appear twice in a chain.
+        """
+        key = self._plugin_key(name, params)
+
+        plugins = live.get(key)
+        if plugins:
+            return plugins.pop()
+
+        plugins = self._plugin_cache.get(key)
+        if plugins:
+            plugin = plugins.pop()
+            if not plugins:
+                del self._plugin_cache[key]
+            # Only cached after the audio thread adopted a board without it
+            # (see _release_retired), so resetting here can't race a process()
+            # call; drop its old tail before it goes back in
+            plugin.reset()
+            return plugin
+
+        return self.EFFECT_MAP[name](**params)
+
+    def set_param(self, index: int, param: str, value: float):
+        """Change one parameter of the effect at `index` in the live chain"""
+        value = self._clamp(self._chain_names[index], param, value)
+        self._chain_params[index][param] = value
+        board = self._pending_board
+        if isinstance(board, ScalarChain):
+            board.set_parameter(index, value)
+        else:
+            # A single float store on the plugin; no rebuild, no lock
+            setattr(board[index], param, value)
+
+    def process_chunk(self, audio_chunk: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Process a (frames, channels) chunk through the effect chain.
+
+        The result is written into `out` when given (e.g. the stream's outdata),
+        otherwise into a new array - or, for an empty chain, the float32 input
+        itself is returned.
+        """
+        # Adopt a newly published chain without blocking on the GUI thread
+        board = self._pending_board
+        if board is not self.board:
+            self.board = board
+            self._board_len = len(board)
+
+        if self._board_len == 0:
+            # Dry signal: no scratch, no plugin call, at most one copy into out
+            if out is None:
+                return audio_chunk if audio_chunk.dtype == np.float32 else audio_chunk.astype(np.float32)
+            np.copyto(out, audio_chunk)
+            return out
+
+        frames = len(audio_chunk)
+        if out is None:
+            out = np.empty((frames, self.channels), dtype=np.float32)
+
+        if frames <= self.blocksize:
+            scratch = self._scratch_in[:self.channels * frames].reshape(self.channels, frames)
+        else:
+            scratch = np.empty((self.channels, frames), dtype=np.float32)
+        # Transposes and casts to float32 in one pass, no allocation
+        np.copyto(scratch, audio_chunk.T)
+
+        # No try/except: parameters are validated in update_effects/set_param
+        # Every non-empty board ends in the safety limiter, so this is the
+        # whole chain; reset=False keeps delay/reverb trails between chunks
+        processed = board.process(scratch, self.samplerate, reset=False)
+
+        np.copyto(out, processed.T)
+        return out
+
+    @property
+    def recorded_frames(self) -> int:
+        """Length of the current recording in frames"""
+        return self._writer.frames if self._writer else 0
+
+    @property
+    def recording_overruns(self) -> int:
+        """Blocks of the current take dropped because the writer fell behind"""
+        return self._writer.overruns if self._writer else 0
+
+    def start_recording(self):
+        """Begin a new take, discarding the previous one"""
+        self.discard_recording()
+        self._writer = RecordingWriter(self.samplerate, self.channels, self.blocksize)
+
+    def record(self, processed: np.ndarray):
+        """Hand a processed block to the writer thread's ring"""
+        self._writer.write(processed)
+
+    def stop_recording(self):
+        """Wait for the writer to flush the take to its temporary file"""
+        if self._writer:
+            self._writer.close()
+
+    def discard_recording(self):
+        if self._writer:
+            self._writer.discard()
+            self._writer = None
 
     def save_recording(self, filename: str) -> bool:
-        """Save all recorded chunks to file"""
-        if self.recorded_chunks:
+        """Save the recorded take to file (only once its session has stopped)"""
+        if self._writer is not None and not self._writer.closed:
+            # Closing the writer here would drop the rest of a running take
+            print("Save error: recording still in progress")
+            return False
+        if self.recorded_frames:
             try:
-                audio = np.concatenate(self.recorded_chunks, axis=0)
-                sf.write(filename, audio, self.samplerate)
+                suffix = Path(filename).suffix.lower()
+                if suffix == ".wav":
+                    # Already a WAV on disk - no decode/encode pass
+                    shutil.copyfile(self._writer.path, filename)
+                else:
+                    subtype = self.EXPORT_SUBTYPES.get(suffix)
+                    with sf.SoundFile(self._writer.path) as src, \
+                            sf.SoundFile(filename, "w", self.samplerate, self.channels,
+                                         subtype=subtype) as dst:
+                        # float32 end to end through one reused block buffer
+                        block_buf = np.empty((65536, self.channels), dtype=np.float32)
+                        for block in src.blocks(out=block_buf):
+                            dst.write(block)
                 return True
             except Exception as e:
                 print(f"Save error: {e}")
@@ -159,22 +513,27 @@ class LiveRecordingSession:
         """Start live recording with real-time effects"""
         self.is_running = True
         self.processor.is_active = True
-        self.processor.recorded_chunks = []
+        self.processor.status_count = 0
+        self.processor.start_recording()
 
         def audio_callback(indata, outdata, frames, time_info, status):
             if status:
-                print(f"Status: {status}")
+                # No I/O on the audio thread - the GUI polls these
+                self.processor.status_count += 1
+                self.processor.last_status = status
 
             if self.is_running:
-                processed = self.processor.process_chunk(indata.copy())
-                self.processor.recorded_chunks.append(processed.copy())
-                outdata[:] = processed
+                # Processed straight into the output buffer, then recorded from there
+                self.processor.process_chunk(indata, out=outdata)
+                self.processor.record(outdata)
             else:
-                outdata[:] = np.zeros_like(indata)
+                outdata.fill(0)
 
         self.stream = sd.Stream(
             samplerate=self.processor.samplerate,
-            channels=2,
+            blocksize=self.processor.blocksize,
+            latency=self.processor.latency,
+            channels=self.processor.channels,
             callback=audio_callback,
             dtype='float32'
         )
@@ -186,12 +545,22 @@ class LiveRecordingSession:
         if self.stream:
             self.stream.stop()
             self.stream.close()
+        self.processor.stop_recording()
         self.processor.is_active = False
 
 
 class FilePlaybackSession:
     """Manages file playback with real-time effects"""
 
+    # Files longer than this are streamed from disk instead of loaded into RAM
+    # (a minute of float32 stereo at 44.1 kHz is ~21 MB). Reads happen on the
+    # render thread, so streaming costs the audio callback nothing
+    STREAM_MIN_SECONDS = 60
+    # Frames per read when scanning a streamed file for its peak
+    SCAN_BLOCKSIZE = 65536
+    # Blocks rendered ahead of the audio callback, absorbing uneven plugin cost
+    LOOKAHEAD_BLOCKS = 4
+
     def __init__(self, processor: RealTimeAudioProcessor, audio_file: str):
         self.processor = processor
         self.audio_file = audio_file
@@ -199,70 +568,200 @@ class FilePlaybackSession:
         self.is_running = False
         self.audio_data = None
         self.current_frame = 0
+        self.total_frames = 0
+        self.loaded = False
+        # Zero-padded staging for the final partial block of the file
+        self._tail_buf = np.zeros((processor.blocksize, processor.channels), dtype=np.float32)
+        # Streaming mode: open file, normalization gain and a reusable read buffer
+        self._sf: Optional[sf.SoundFile] = None
+        self._gain = 1.0
+        self._chunk_buf = None
+
+        # Lookahead render ring: a worker thread (single producer) processes
+        # blocks ahead of time, the audio callback (single consumer) only copies
+        self._render_ring = np.zeros(
+            (self.LOOKAHEAD_BLOCKS, processor.blocksize, processor.channels), dtype=np.float32
+        )
+        self._render_lengths = [0] * self.LOOKAHEAD_BLOCKS
+        self._render_index = 0
+        self._play_index = 0
+        self._render_frame = 0
+        self._render_done = False
+        self._render_thread: Optional[threading.Thread] = None
+        # Set if the render thread failed; playback then ends early
+        self.error: Optional[Exception] = None
+
+    @staticmethod
+    def _peak(data: np.ndarray) -> float:
+        """Peak absolute amplitude via two reductions - no abs() temporary"""
+        return max(-float(data.min()), float(data.max()))
+
+    @staticmethod
+    def _normalize_gain(max_val: float) -> float:
+        """Gain that leaves headroom for effects when the file is (near) clipping"""
+        # Clipping (above 0dB) or merely very loud files are both brought down
+        # to a 0.5 peak, leaving headroom for distortion or reverb to add volume
+        if max_val <= 0.8:
+            return 1.0
+        if max_val > 1.0:
+            print(f"Warning: Audio file clipped (max: {max_val:.2f}). Normalizing...")
+        return 0.5 / max_val
 
     def load_file(self):
         """Load audio file with safety checks for format and volume"""
         try:
+            info = sf.info(self.audio_file)
+            if info.frames > self.STREAM_MIN_SECONDS * info.samplerate:
+                return self._open_stream(info)
+
             # Read file always as float32
             data, samplerate = sf.read(self.audio_file, always_2d=True, dtype='float32')
 
             # --- FIX: NORMALIZE AUDIO IF IT CLIPS ---
             # Check maximum amplitude
-            max_val = np.max(np.abs(data))
-
-            # If the file is louder than 0dB (1.0), normalize it down
-            # This leaves headroom for effects like distortion or reverb to add volume
-            if max_val > 1.0:
-                print(f"Warning: Audio file clipped (max: {max_val:.2f}). Normalizing...")
-                data = data / max_val * 0.5
-            elif max_val > 0.8:
-                # Even if it's not technically clipping, if it's very loud,
-                # reduce it slightly to -3dB to give headroom for effects.
-                data = data / max_val * 0.5
+            gain = self._normalize_gain(self._peak(data))
+            if gain != 1.0:
+                # In place - a long file must not need two copies in RAM
+                data *= gain
 
             self.audio_data = data
+            self.total_frames = len(data)
+            self.loaded = True
             return True
         except Exception as e:
             print(f"Load error: {e}")
             return False
 
+    def _open_stream(self, info):
+        """Prepare disk streaming: one peak scan, then read blocks on demand"""
+        # One block buffer reused for the whole scan, so memory stays O(block)
+        scan_buf = np.empty((self.SCAN_BLOCKSIZE, info.channels), dtype=np.float32)
+        max_val = 0.0
+        for block in sf.blocks(self.audio_file, out=scan_buf):
+            max_val = max(max_val, self._peak(block))
+        self._gain = self._normalize_gain(max_val)
+
+        self._sf = sf.SoundFile(self.audio_file)
+        self._chunk_buf = np.empty((self.processor.blocksize, info.channels), dtype=np.float32)
+        self.total_frames = info.frames
+        self.loaded = True
+        return True
+
+    def _read_chunk(self, start: int, end: int) -> np.ndarray:
+        """Frames [start, end) of the (normalized) file"""
+        if self._sf is None:
+            return self.audio_data[start:end]
+
+        chunk = self._sf.read(end - start, dtype='float32', always_2d=True,
+                              out=self._chunk_buf[:end - start])
+        if self._gain != 1.0:
+            chunk *= self._gain
+        return chunk
+
+    def _render_next(self) -> bool:
+        """Render one block into the ring; False if the ring is full or the file done"""
+        if self._render_done or self._render_index - self._play_index >= self.LOOKAHEAD_BLOCKS:
+            return False
+
+        blocksize = self.processor.blocksize
+        start_frame = self._render_frame
+        end_frame = min(start_frame + blocksize, self.total_frames)
+        chunk = self._read_chunk(start_frame, end_frame)
+        # A streamed read can come back short of what the header promised
+        read_frames = len(chunk)
+
+        if read_frames < blocksize:
+            tail = self._tail_buf
+            tail.fill(0)
+            tail[:read_frames] = chunk
+            chunk = tail
+
+        slot = self._render_index % self.LOOKAHEAD_BLOCKS
+        self.processor.process_chunk(chunk, out=self._render_ring[slot])
+        self._render_lengths[slot] = read_frames
+        # Publish only after the slot is filled
+        self._render_index += 1
+
+        self._render_frame = start_frame + read_frames
+        if read_frames < blocksize or self._render_frame >= self.total_frames:
+            self._render_done = True
+        return True
+
+    def _render_loop(self):
+        """Worker thread: keep the lookahead ring topped up"""
+        # Half a block between checks when the ring is full
+        idle = self.processor.blocksize / self.processor.samplerate / 2
+        try:
+            while self.is_running and not self._render_done:
+                if not self._render_next():
+                    time.sleep(idle)
+        except Exception as e:
+            # End playback once the rendered blocks drain; the GUI reports it
+            print(f"Playback error: {e}")
+            self.error = e
+            self._render_done = True
+
     def start(self):
         """Start playback with real-time effects"""
-        if not self.load_file():
+        # The file may already have been loaded off the GUI thread
+        if not self.loaded and not self.load_file():
             return False
 
         self.is_running = True
         self.processor.is_active = True
-        self.processor.recorded_chunks = []
+        self.processor.status_count = 0
+        self.processor.start_recording()
         self.current_frame = 0
+        if self._sf is not None:
+            self._sf.seek(0)
+
+        self._render_index = 0
+        self._play_index = 0
+        self._render_frame = 0
+        self._render_done = False
+        self.error = None
+        # Prefill so the first callbacks never find the ring empty
+        while self._render_next():
+            pass
+        self._render_thread = threading.Thread(target=self._render_loop, daemon=True)
+        self._render_thread.start()
 
         def audio_callback(outdata, frames, time_info, status):
             if status:
-                print(f"Status: {status}")
-
-            if self.is_running and self.current_frame < len(self.audio_data):
-                end_frame = min(self.current_frame + frames, len(self.audio_data))
-                chunk = self.audio_data[self.current_frame:end_frame]
-
-                if len(chunk) < frames:
-                    chunk = np.pad(chunk, ((0, frames - len(chunk)), (0, 0)))
-
-                processed = self.processor.process_chunk(chunk)
-                self.processor.recorded_chunks.append(processed[:end_frame - self.current_frame].copy())
-
-                outdata[:] = processed
-                self.current_frame = end_frame
-
-                if self.current_frame >= len(self.audio_data):
-                    self.is_running = False
+                # No I/O on the audio thread - the GUI polls these
+                self.processor.status_count += 1
+                self.processor.last_status = status
+
+            if not self.is_running:
+                # Let PortAudio finish the stream instead of calling us again
+                outdata.fill(0)
+                raise sd.CallbackStop
+
+            if self._play_index < self._render_index:
+                slot = self._play_index % self.LOOKAHEAD_BLOCKS
+                block = self._render_ring[slot]
+                read_frames = self._render_lengths[slot]
+
+                outdata[:] = block
+                self.processor.record(block[:read_frames])
+                # Frees the slot for the render thread
+                self._play_index += 1
+                self.current_frame += read_frames
+            elif self._render_done:
+                outdata.fill(0)
+                self.is_running = False
+                raise sd.CallbackStop
             else:
-                outdata[:] = np.zeros((frames, 2))
-                if self.current_frame >= len(self.audio_data):
-                    self.is_running = False
+                # Render thread fell behind: play silence rather than block
+                outdata.fill(0)
+                self.processor.status_count += 1
+                self.processor.last_status = "render underrun"
 
         self.stream = sd.OutputStream(
             samplerate=self.processor.samplerate,
-            channels=2,
+            blocksize=self.processor.blocksize,
+            latency=self.processor.latency,
+            channels=self.processor.channels,
             callback=audio_callback,
             dtype='float32'
         )
@@ -275,4 +774,12 @@ class FilePlaybackSession:
         if self.stream:
             self.stream.stop()
             self.stream.close()
+        if self._render_thread is not None:
+            self._render_thread.join()
+            self._render_thread = None
+        if self._sf is not None:
+            self._sf.close()
+            self._sf = None
+            self.loaded = False
+        self.processor.stop_recording()
         self.processor.is_active = False
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+audio_kernels.py
+Numba-compiled DSP kernels for chains Pedalboard would otherwise run plugin by plugin.
+Numba is optional: without it HAVE_NUMBA is False and the engine keeps using Pedalboard.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator so the kernels still import (uncompiled) without Numba"""
+        def wrap(func):
+            return func
+        return wrap
+
+# Per-sample operations the fused kernel understands
+OP_GAIN = 0
+OP_CLIP = 1
+OP_BITCRUSH = 2
+OP_DISTORTION = 3
+
+
+@njit(fastmath=True, cache=True)
+def scalar_chain_inplace(x, kinds, values):
+    """Apply a chain of per-sample ops to a (channels, frames) block in one pass.
+
+    kinds[k] is one of the OP_* codes; values[k] is its precomputed operand:
+    linear gain, linear clip threshold, bitcrush quantization scale, or
+    linear distortion drive.
+    """
+    for c in range(x.shape[0]):
+        for i in range(x.shape[1]):
+            v = x[c, i]
+            for k in range(kinds.shape[0]):
+                kind = kinds[k]
+                if kind == OP_GAIN:
+                    v = v * values[k]
+                elif kind == OP_CLIP:
+                    v = min(max(v, -values[k]), values[k])
+                elif kind == OP_BITCRUSH:
+                    v = np.rint(v * values[k]) / values[k]
+                else:
+                    v = np.tanh(v * values[k])
+            x[c, i] = v
+    return x
+
+
+class ScalarChain:
+    """Fused replacement for a Pedalboard made only of Gain/Clipping/Bitcrush/Distortion.
+
+    Quacks like Pedalboard where the processor needs it (len, process). An
+    optional `post` plugin (the engine's safety limiter) runs after the kernel,
+    so the whole chain is still a single process() call.
+    """
+
+    # Effect name -> (op code, parameter name, converter to kernel operand)
+    SUPPORTED = {
+        "Gain": (OP_GAIN, "gain_db", lambda db: 10.0 ** (db / 20.0)),
+        "Clipping": (OP_CLIP, "threshold_db", lambda db: 10.0 ** (db / 20.0)),
+        "Bitcrush": (OP_BITCRUSH, "bit_depth", lambda bits: 2.0 ** bits),
+        # Pedalboard's Distortion is tanh of the driven signal
+        "Distortion": (OP_DISTORTION, "drive_db", lambda db: 10.0 ** (db / 20.0)),
+    }
+
+    def __init__(self, kinds: np.ndarray, values: np.ndarray, converters, post=None):
+        self.kinds = kinds
+        self.values = values
+        self._converters = converters
+        self.post = post
+
+    @classmethod
+    def from_configs(cls, effect_configs, post=None):
+        """Build a fused chain, or return None if any effect isn't supported"""
+        if not HAVE_NUMBA or not effect_configs:
+            return None
+
+        kinds, values, converters = [], [], []
+        for effect_config in effect_configs:
+            spec = cls.SUPPORTED.get(effect_config["name"])
+            if spec is None:
+                return None
+            kind, param, convert = spec
+            kinds.append(kind)
+            values.append(convert(effect_config["parameters"][param]))
+            converters.append(convert)
+
+        return cls(np.array(kinds, dtype=np.int64), np.array(values, dtype=np.float32), converters, post)
+
+    def set_parameter(self, index: int, value: float):
+        """Update one op's operand in place (each supported effect has one parameter)"""
+        self.values[index] = self._converters[index](value)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def process(self, x: np.ndarray, samplerate, reset=False) -> np.ndarray:
+        """Process a float32 (channels, frames) block in place, then through `post`"""
+        x = scalar_chain_inplace(x, self.kinds, self.values)
+        if self.post is None:
+            return x
+        return self.post.process(x, samplerate, reset=False)
+
+
+def warm_up():
+    """Compile (or load from cache) the kernels off the audio thread"""
+    if HAVE_NUMBA:
+        kinds = np.array([OP_GAIN, OP_CLIP, OP_BITCRUSH, OP_DISTORTION], dtype=np.int64)
+        values = np.ones(4, dtype=np.float32)
+        scalar_chain_inplace(np.zeros((2, 512), dtype=np.float32), kinds, values)